@@ -1,23 +1,118 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import datetime, timedelta
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import Platform
-
-from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_NAME, DEFAULT_PORT, DEFAULT_NAME, PLATFORMS
-from .avalon_api import AvalonMiniClient
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    PLATFORMS,
+)
+from .avalon_api import AvalonMiniAsyncClient, ParsedState
 
 _LOGGER = logging.getLogger(__name__)
 
-
-async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
-    """Set up the Avalon Mini integration (no YAML config needed)."""
-    # If you want to support YAML import, you can handle DOMAIN in config here
-    # and call hass.config_entries.flow.async_init(..., context={"source": SOURCE_IMPORT}, ...)
-    return True
+# Delay before re-reading the miner after a write, giving it time to apply
+# the change; repeated requests inside the window collapse into one refresh.
+REQUEST_REFRESH_COOLDOWN = 5
+
+# Shortest gap between pings that keep an idle miner connection open; the
+# actual keepalive runs at half the polling interval (see
+# async_schedule_keepalive), so longer intervals also mean fewer pings
+KEEPALIVE_INTERVAL = timedelta(seconds=15)
+
+
+class AvalonMiniCoordinator(DataUpdateCoordinator[ParsedState]):
+    """Fetch summary/estats once per cycle and share them with all entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: AvalonMiniAsyncClient,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {name}",
+            update_interval=update_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+        self.client = client
+        self._unsub_keepalive: Callable[[], None] | None = None
+
+    @callback
+    def async_set_status(self, **changes: Any) -> None:
+        """Optimistically apply status fields after a successful write."""
+        self.async_set_updated_data(replace(self.data, **changes))
+
+    async def async_keepalive(self, _now: datetime) -> None:
+        """Keep the client's connection warm between polls."""
+        await self.client.async_keepalive()
+
+    @callback
+    def async_schedule_keepalive(self) -> None:
+        """(Re)start the keepalive timer for the current polling interval.
+
+        Pings go out at half the polling interval, but no more often than
+        KEEPALIVE_INTERVAL, so they never outnumber the polls two to one.
+        Polls that come at least that often keep the connection open on
+        their own and get no keepalive at all.
+        """
+        self.async_cancel_keepalive()
+        if self.update_interval is None or self.update_interval <= KEEPALIVE_INTERVAL:
+            return
+        interval = max(KEEPALIVE_INTERVAL, self.update_interval / 2)
+        self._unsub_keepalive = async_track_time_interval(
+            self.hass, self.async_keepalive, interval
+        )
+
+    @callback
+    def async_cancel_keepalive(self) -> None:
+        if self._unsub_keepalive is not None:
+            self._unsub_keepalive()
+            self._unsub_keepalive = None
+
+    async def _async_update_data(self) -> ParsedState:
+        """Fetch summary + estats once and parse every field from them."""
+        try:
+            return await self.client.async_poll_all()
+        except OSError as err:
+            raise UpdateFailed(f"Error communicating with Avalon Mini: {err}") from err
+
+
+def _scan_interval(entry: ConfigEntry) -> timedelta:
+    """How often the coordinator polls the miner (summary + estats)."""
+    return timedelta(seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a changed polling interval without reloading the entry."""
+    coordinator: AvalonMiniCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator.update_interval = _scan_interval(entry)
+    coordinator.async_schedule_keepalive()
+    _LOGGER.debug("Avalon Mini '%s' now polls every %s", entry.title, coordinator.update_interval)
+    # The next poll is still timed with the old interval; poll now so the
+    # schedule restarts from the new one
+    await coordinator.async_refresh()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -28,11 +123,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info("Setting up Avalon Mini entry '%s' (%s:%s)", name, host, port)
 
-    client = AvalonMiniClient(host, port)
+    client = AvalonMiniAsyncClient(host, port)
+    coordinator = AvalonMiniCoordinator(hass, client, name, _scan_interval(entry))
+    await coordinator.async_config_entry_first_refresh()
+    coordinator.async_schedule_keepalive()
+    entry.async_on_unload(coordinator.async_cancel_keepalive)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
+        "coordinator": coordinator,
         "name": name,
     }
 
@@ -52,7 +153,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if data is not None:
+            await data["client"].async_close()
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN, None)
 
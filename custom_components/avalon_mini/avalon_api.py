@@ -1,46 +1,289 @@
-import socket
+import asyncio
+from dataclasses import dataclass
 import logging
+import socket
 import time
 import re
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for a connect or a reply
+DEFAULT_TIMEOUT = 5.0
+
+# Receive buffer for the API socket; estats replies are a few KB
+_RCVBUF_SIZE = 65536
+
+# Largest reply the stream reader buffers before giving up on it
+_READ_LIMIT = 1024 * 1024
+
+# API commands, pre-encoded once; setters only append the variable tail
+_CMD_SUMMARY = b"summary"
+_CMD_ESTATS = b"estats"
+_CMD_VERSION = b"version"
+_CMD_SOFTON = b"ascset|0,softon,1:"
+_CMD_SOFTOFF = b"ascset|0,softoff,1:"  # TODO: adjust if your docs say 'softoff'
+_CMD_WORKMODE = b"ascset|0,workmode,set,"
+_CMD_WORKLEVEL = b"ascset|0,worklevel,set,"
+_CMD_DISPLAY = b"ascset|0,display,set,"  # TODO: adjust to your real display command
+
+# Quiet period before a write is sent; a newer write of the same setting
+# inside the window replaces the pending one
+_WRITE_DEBOUNCE = 0.25
+
+# estats bracket fields read on each poll, collected in one pass over the reply
+_ESTATS_KEYS = frozenset(
+    (
+        "SYSTEMSTATU",
+        "ITemp",
+        "TarT",
+        "PS",
+        "WORKMODE",
+        "WORKLEVEL",
+        "SoftOFF",
+        "LcdOnoff",
+    )
+)
+
+# Integer status fields: (status key, estats key)
+_STATUS_INT_FIELDS = (
+    ("workmode", "WORKMODE"),
+    ("worklevel", "WORKLEVEL"),
+    ("softoff", "SoftOFF"),
+    ("lcd_on", "LcdOnoff"),
+)
+
+# Pulls "In Work" out of SYSTEMSTATU[Work: In Work, Hash Board: 1]
+_RE_SYSTEM_WORK = re.compile(r"Work:\s*([^,]+)")
 
-class AvalonMiniClient:
-    """Low-level TCP client for the Avalon Mini 3 cgminer API."""
+# SUMMARY hashrate keys, in order of preference
+_HASHRATE_KEYS = ("MHS 5s", "MHS av", "MHS 1m", "MHS 5m", "MHS 15m")
 
-    def __init__(self, host: str, port: int = 4028, timeout: float = 5.0) -> None:
+
+@dataclass(frozen=True)
+class ParsedState:
+    """Everything the entities display, parsed once per poll."""
+
+    workmode: int | None = None
+    worklevel: int | None = None
+    softoff: int | None = None
+    lcd_on: int | None = None
+    system_work: str | None = None
+    room_c: float | None = None
+    target_c: float | None = None
+    power_w: float | None = None
+    hashrate_mhs: float | None = None
+
+
+class AvalonMiniAsyncClient:
+    """Low-level asyncio TCP client for the Avalon Mini 3 cgminer API."""
+
+    def __init__(self, host: str, port: int = 4028, timeout: float = DEFAULT_TIMEOUT) -> None:
         self._host = host
         self._port = port
         self._timeout = timeout
+        # One long-lived connection, serialized across callers on the event loop
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        # Debounced writes: setting -> (timer, command, future shared by callers)
+        self._pending_writes: dict[
+            str, tuple[asyncio.TimerHandle, bytes, asyncio.Future[str]]
+        ] = {}
+        self._write_tasks: set[asyncio.Task] = set()
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port, limit=_READ_LIMIT),
+            self._timeout,
+        )
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            # Commands are tiny: never hold them back for Nagle coalescing
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                # Room for a whole estats reply in the kernel buffer
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+            except OSError:
+                pass
+
+    def _connection_alive(self) -> bool:
+        """Cheap liveness check of the persistent connection (no I/O)."""
+        return (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        )
+
+    async def _ensure_connection(self) -> None:
+        """Reconnect up front if the miner already closed the connection."""
+        if not self._connection_alive():
+            self._disconnect()
+            await self._connect()
 
-    def _send_cmd(self, cmd: str) -> str:
-        """Send a raw command string and return the response."""
+    def _disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    async def async_close(self) -> None:
+        """Close the persistent connection (it is reopened on the next command)."""
+        # Fail, rather than cancel, what the waiting service calls get back
+        for handle, _, future in self._pending_writes.values():
+            handle.cancel()
+            future.set_exception(ConnectionError("Avalon Mini client closed"))
+        self._pending_writes.clear()
+        # Flushed writes may still be queued on the lock; never send them
+        tasks = list(self._write_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        async with self._lock:
+            writer = self._writer
+            self._disconnect()
+            if writer is not None:
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+
+    async def _write_cmd(self, cmd: bytes) -> None:
+        """Send one command on the persistent connection."""
+        await self._ensure_connection()
+        # cgminer reads one bare command per recv(); no terminator is sent
+        self._writer.write(cmd)
+        await self._writer.drain()
+
+    async def _read_reply(self) -> str:
+        """Read one reply from the persistent connection."""
+        try:
+            # cgminer terminates each API reply with a NUL byte
+            data = await asyncio.wait_for(self._reader.readuntil(b"\x00"), self._timeout)
+        except asyncio.LimitOverrunError as err:
+            # Not an OSError; the caller drops the half-read connection
+            raise ConnectionError("reply from Avalon Mini too large") from err
+        except asyncio.IncompleteReadError as err:
+            if not err.partial:
+                raise ConnectionError("connection closed by Avalon Mini") from err
+            # Peer closed after replying; reconnect on the next command
+            data = err.partial
+            self._disconnect()
+        # Decode straight from the read buffer, dropping the terminator
+        # through a memoryview instead of copying the reply with rstrip()
+        end = len(data) - 1 if data.endswith(b"\x00") else len(data)
+        return str(memoryview(data)[:end], "ascii", "ignore")
+
+    async def _exchange_with_retry(self, cmd: bytes, resend: bool = True) -> str:
+        """Exchange one command, reconnecting once if the connection was stale.
+
+        With resend=False (ascset writes) the command is only retried if it
+        failed before it was sent, as the miner may already have applied it.
+
+        Must be called with self._lock held.
+        """
         _LOGGER.debug("Sending command to Avalon Mini: %s", cmd)
-        with socket.create_connection((self._host, self._port), timeout=self._timeout) as sock:
-            sock.sendall(cmd.encode("ascii"))
-            sock.shutdown(socket.SHUT_WR)
-            chunks = []
-            while True:
-                data = sock.recv(4096)
-                if not data:
-                    break
-                chunks.append(data)
-        response = b"".join(chunks).decode("ascii", errors="ignore")
+        reused = self._connection_alive()
+        sent = False
+        try:
+            await self._write_cmd(cmd)
+            sent = True
+            response = await self._read_reply()
+        except OSError as err:
+            self._disconnect()
+            if not reused or (sent and not resend):
+                raise
+            # The miner may have dropped the idle connection; retry once
+            _LOGGER.debug("Stale connection to Avalon Mini (%s), reconnecting", err)
+            try:
+                await self._write_cmd(cmd)
+                response = await self._read_reply()
+            except BaseException:
+                self._disconnect()
+                raise
+        except BaseException:
+            # Never leave a half-read reply on a connection that is reused
+            self._disconnect()
+            raise
         _LOGGER.debug("Received from Avalon Mini: %s", response)
         return response
 
-    # --- Optional helpers for debugging/status ---
+    async def _send_cmd(self, cmd: bytes, resend: bool = True) -> str:
+        """Send a raw, ASCII-encoded command and return the response."""
+        async with self._lock:
+            return await self._exchange_with_retry(cmd, resend)
+
+    async def async_keepalive(self) -> None:
+        """
+        Ping an idle, still-open connection so the miner does not reap it.
+
+        Does nothing while a command is in flight or once the connection
+        is gone; the next real command reconnects in that case.
+        """
+        if self._lock.locked() or not self._connection_alive():
+            return
+        try:
+            await self._send_cmd(_CMD_VERSION)
+        except OSError as err:
+            _LOGGER.debug("Keepalive to Avalon Mini failed: %s", err)
+
+    async def _async_write(self, setting: str, cmd: bytes) -> str:
+        """
+        Send a write command after a short debounce window.
+
+        If another write for the same setting arrives inside the window, the
+        earlier command is dropped and every caller gets the reply to the
+        latest one, so rapid UI changes reach the miner as a single write.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending_writes.get(setting)
+        if pending is not None:
+            handle, _, future = pending
+            handle.cancel()
+        else:
+            future = loop.create_future()
+        handle = loop.call_later(_WRITE_DEBOUNCE, self._flush_write, setting)
+        self._pending_writes[setting] = (handle, cmd, future)
+        return await asyncio.shield(future)
+
+    def _flush_write(self, setting: str) -> None:
+        _, cmd, future = self._pending_writes.pop(setting)
+        task = asyncio.get_running_loop().create_task(self._async_flush_write(cmd, future))
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _async_flush_write(self, cmd: bytes, future: asyncio.Future[str]) -> None:
+        try:
+            # Never re-sent once written: the miner may have applied it
+            response = await self._send_cmd(cmd, resend=False)
+        except asyncio.CancelledError:
+            # Closed before the write went out
+            if not future.done():
+                future.set_exception(ConnectionError("Avalon Mini client closed"))
+            raise
+        except Exception as err:  # handed to the waiting callers
+            if not future.done():
+                future.set_exception(err)
+            return
+        if not future.done():
+            future.set_result(response)
 
-    def summary(self) -> str:
-        return self._send_cmd("summary")
+    # --- Polling ---
 
-    def estats(self) -> str:
-        return self._send_cmd("estats")
+    async def async_poll_all(self) -> ParsedState:
+        """
+        Fetch 'summary' and 'estats' in one locked batch and parse them.
+
+        Both commands go out back-to-back on the same connection, so a poll
+        cycle takes the lock and checks the connection once.
+        """
+        async with self._lock:
+            summary = await self._exchange_with_retry(_CMD_SUMMARY)
+            estats = await self._exchange_with_retry(_CMD_ESTATS)
+        return parse_state(summary, estats)
 
     # --- Power control ---
 
-    def power_on(self) -> str:
+    async def async_power_on(self) -> str:
         """
         Turn the device on (soft start).
 
@@ -48,11 +291,9 @@ class AvalonMiniClient:
           ascset|0,softon,1:timestamp
         where timestamp is current UNIX epoch seconds.
         """
-        timestamp = int(time.time())
-        cmd = f"ascset|0,softon,1:{timestamp}"
-        return self._send_cmd(cmd)
+        return await self._async_write("power", _CMD_SOFTON + b"%d" % time.time())
 
-    def power_off(self) -> str:
+    async def async_power_off(self) -> str:
         """
         Turn the device off / standby.
 
@@ -61,13 +302,11 @@ class AvalonMiniClient:
         If your docs use a different command (e.g. 'softoff'),
         update this line accordingly.
         """
-        timestamp = int(time.time())
-        cmd = f"ascset|0,softoff,1:{timestamp}"  # TODO: adjust if your docs say 'softoff'
-        return self._send_cmd(cmd)
+        return await self._async_write("power", _CMD_SOFTOFF + b"%d" % time.time())
 
     # --- Mode: Heating / Mining / Night ---
 
-    def set_mode_index(self, index: int) -> str:
+    async def async_set_mode_index(self, index: int) -> str:
         """
         Set workmode by index.
 
@@ -76,12 +315,11 @@ class AvalonMiniClient:
           1 = Mining
           2 = Night
         """
-        cmd = f"ascset|0,workmode,set,{index}"
-        return self._send_cmd(cmd)
+        return await self._async_write("workmode", _CMD_WORKMODE + b"%d" % index)
 
     # --- Level: Eco / Super ---
 
-    def set_level_index(self, index: int) -> str:
+    async def async_set_level_index(self, index: int) -> str:
         """
         Set worklevel by index.
 
@@ -89,12 +327,11 @@ class AvalonMiniClient:
           -1 = Eco
            0 = Super
         """
-        cmd = f"ascset|0,worklevel,set,{index}"
-        return self._send_cmd(cmd)
+        return await self._async_write("worklevel", _CMD_WORKLEVEL + b"%d" % index)
 
     # --- Display on/off ---
 
-    def set_display(self, on: bool) -> str:
+    async def async_set_display(self, on: bool) -> str:
         """
         Toggle the front display.
 
@@ -105,51 +342,184 @@ class AvalonMiniClient:
           ascset|0,display,set,1  (on)
           ascset|0,display,set,0  (off)
         """
-        value = 1 if on else 0
-        cmd = f"ascset|0,display,set,{value}"  # TODO: adjust to your real display command
-        return self._send_cmd(cmd)
-        
-        
-    def get_status(self) -> dict:
-        """
-        Fetch and parse current status from 'estats'.
+        return await self._async_write("display", _CMD_DISPLAY + (b"1" if on else b"0"))
 
-        Returns a dict with e.g.:
-          - workmode: int (0=heating,1=mining,2=night)
-          - worklevel: int (-1=eco,0=super)
-          - softoff: int (raw SoftOFF value)
-          - lcd_on: int (1 on, 0 off)
-          - system_work: str ("In Work", "In Init", "In Idle", etc.)
-        """
-        raw = self.estats()
-        status: dict = {}
 
-        # WORKMODE[0] WORKLEVEL[0] ...
-        m = re.search(r"WORKMODE\[(\-?\d+)\]", raw)
-        if m:
-            status["workmode"] = int(m.group(1))
+def parse_state(summary: str, estats: str) -> ParsedState:
+    """Parse one 'summary' and one 'estats' reply into a ParsedState."""
+    # One sweep over estats feeds every estats-derived field
+    fields = _sweep_brackets(estats, _ESTATS_KEYS)
+    return ParsedState(
+        **_status_from_fields(fields),
+        room_c=_parse_temperature(fields, "ITemp"),
+        target_c=_parse_temperature(fields, "TarT"),
+        power_w=_parse_power_draw(fields.get("PS")),
+        hashrate_mhs=_parse_hashrate(summary),
+    )
 
-        m = re.search(r"WORKLEVEL\[(\-?\d+)\]", raw)
-        if m:
-            status["worklevel"] = int(m.group(1))
 
-        m = re.search(r"SoftOFF\[(\d+)\]", raw)
-        if m:
-            status["softoff"] = int(m.group(1))
+def _sweep_brackets(raw: str, keys: frozenset[str]) -> dict[str, str]:
+    """Return {key: text inside KEY[...]} for each of keys found in raw.
 
-        m = re.search(r"LcdOnoff\[(\d+)\]", raw)
-        if m:
-            status["lcd_on"] = int(m.group(1))
+    Walks the KEY[...] items of the reply once, front to back, so the
+    result does not depend on firmware field order. A key only matches as
+    a whole token, at the start of the reply or after a space, '=' or '|'
+    (so ITemp does not hit HBITemp[...]). First occurrence of each key wins.
+    """
+    fields: dict[str, str] = {}
+    prev = 0
+    i = raw.find("[")
+    while i >= 0 and len(fields) < len(keys):
+        j = raw.find("]", i + 1)
+        if j < 0:
+            break
+        # The key runs from the last separator since the previous item
+        sep = max(raw.rfind(" ", prev, i), raw.rfind("=", prev, i), raw.rfind("|", prev, i))
+        if sep >= 0 or prev == 0:
+            key = raw[sep + 1 : i]
+            if key in keys and key not in fields:
+                fields[key] = raw[i + 1 : j]
+        prev = j + 1
+        i = raw.find("[", prev)
+    return fields
 
-        # SYSTEMSTATU[Work: In Work, Hash Board: 1]
-        m = re.search(r"SYSTEMSTATU\[(.*?)\]", raw)
+
+def _status_from_fields(fields: dict[str, str]) -> dict:
+    """
+    Build the status fields of a ParsedState from swept estats fields.
+
+    Returns a dict with e.g.:
+      - workmode: int (0=heating,1=mining,2=night)
+      - worklevel: int (-1=eco,0=super)
+      - softoff: int (raw SoftOFF value)
+      - lcd_on: int (1 on, 0 off)
+      - system_work: str ("In Work", "In Init", "In Idle", etc.)
+    """
+    status: dict = {}
+
+    # WORKMODE[0] WORKLEVEL[0] ...
+    for name, key in _STATUS_INT_FIELDS:
+        value = fields.get(key)
+        if value is None:
+            continue
+        try:
+            status[name] = int(value)
+        except ValueError:
+            pass
+
+    # SYSTEMSTATU[Work: In Work, Hash Board: 1]
+    system_str = fields.get("SYSTEMSTATU")
+    if system_str is not None:
+        # Try to pull out the "Work: XXX" bit specifically
+        m = _RE_SYSTEM_WORK.search(system_str)
         if m:
-            system_str = m.group(1)
-            # Try to pull out the "Work: XXX" bit specifically
-            m2 = re.search(r"Work:\s*([^,]+)", system_str)
-            if m2:
-                status["system_work"] = m2.group(1).strip()
-            else:
-                status["system_work"] = system_str.strip()
-
-        return status
+            status["system_work"] = m.group(1).strip()
+        else:
+            status["system_work"] = system_str.strip()
+
+    return status
+
+
+def _find_kv(raw: str, needle: str) -> int:
+    """Index of needle where it starts a cgminer KV item, or -1.
+
+    Only hits at the start of the reply or right after a ',' or '|'
+    count, so a key that merely ends with the needle is not matched.
+    """
+    i = raw.find(needle)
+    while i > 0 and raw[i - 1] not in ",|":
+        i = raw.find(needle, i + 1)
+    return i
+
+
+def _parse_hashrate(raw: str) -> float | None:
+    """Pick the best available MHS key from SUMMARY and return MH/s."""
+    # Directed str.find per key, in preference order; stop at the first
+    # value that parses, so nothing else in SUMMARY is tokenized.
+    mh_s = None
+    chosen_key = None
+    for key in _HASHRATE_KEYS:
+        i = _find_kv(raw, key + "=")
+        if i < 0:
+            continue
+        start = i + len(key) + 1
+        # The value ends at the next KV (",") or section ("|") separator
+        end = raw.find(",", start)
+        pipe = raw.find("|", start)
+        if end < 0 or 0 <= pipe < end:
+            end = pipe
+        value = raw[start:end] if end >= 0 else raw[start:]
+        try:
+            mh_s = float(value)  # value is in MH/s
+        except ValueError:
+            _LOGGER.warning("Cannot parse hashrate value '%s' (key '%s')", value, key)
+            continue
+        chosen_key = key
+        break
+
+    if mh_s is None:
+        _LOGGER.debug("No hashrate key found in summary: %s", raw)
+        return None
+
+    _LOGGER.debug("Parsed hashrate from %s = %.2f MH/s", chosen_key, mh_s)
+    return mh_s
+
+
+def _parse_temperature(fields: dict[str, str], key: str) -> float | None:
+    """Parse a temperature field (ITemp room, TarT target) from swept estats."""
+    # estats includes e.g. ITemp[31] TarT[90]
+    value = fields.get(key)
+    if value is None:
+        _LOGGER.debug("No %s[...] value found in estats", key)
+        return None
+
+    try:
+        temp = float(value)
+    except ValueError:
+        _LOGGER.warning("Failed to parse %s value '%s'", key, value)
+        return None
+
+    _LOGGER.debug("Parsed temperature %s => %.2f°C", key, temp)
+    return temp
+
+
+def _parse_power_draw(contents: str | None) -> float | None:
+    """
+    Parse the PS[...] contents from estats and use one of the values as watts.
+
+    Example estats fragment:
+      PS[0 1215 2034 37 756 2032 808]
+
+    Based on observation, the 5th value (index 4) appears to represent
+    power draw in watts (~756 W here). If you discover official docs or
+    different mapping, adjust the index below.
+    """
+    if contents is None:
+        _LOGGER.debug("No PS[...] field found in estats")
+        return None
+
+    contents = contents.strip()
+    if not contents:
+        _LOGGER.debug("Empty PS[...] contents in estats")
+        return None
+
+    # Index 4 is all we need; stop tokenizing after it
+    parts: list[str] = contents.split(None, 5)
+    # Need at least 5 elements to read index 4 safely
+    if len(parts) < 5:
+        _LOGGER.debug("Unexpected PS format '%s' (need >=5 values)", contents)
+        return None
+
+    # Use index 4 as power in watts (e.g. '756' in the example above)
+    power_str = parts[4]
+
+    try:
+        watts = float(power_str)
+    except ValueError:
+        _LOGGER.warning(
+            "Failed to parse power value '%s' from PS[%s]", power_str, contents
+        )
+        return None
+
+    _LOGGER.debug("Parsed power draw from PS[...] => %.1f W", watts)
+    return watts
@@ -6,9 +6,19 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_NAME, DEFAULT_PORT, DEFAULT_NAME
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_NAME,
+    DEFAULT_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +42,14 @@ class AvalonMiniConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow (polling interval)."""
+        return AvalonMiniOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step."""
         errors: dict[str, str] = {}
@@ -46,12 +64,16 @@ class AvalonMiniConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 host = user_input[CONF_HOST]
                 port = user_input.get(CONF_PORT, DEFAULT_PORT)
 
-                for entry in self._async_current_entries():
-                    if (
-                        entry.data.get(CONF_HOST) == host
-                        and entry.data.get(CONF_PORT, DEFAULT_PORT) == port
-                    ):
-                        return self.async_abort(reason="already_configured")
+                await self.async_set_unique_id(f"{host}:{port}")
+                self._abort_if_unique_id_configured()
+
+                # Entries created before unique IDs were set only carry host/port
+                existing = {
+                    (entry.data.get(CONF_HOST), entry.data.get(CONF_PORT, DEFAULT_PORT))
+                    for entry in self._async_current_entries()
+                }
+                if (host, port) in existing:
+                    return self.async_abort(reason="already_configured")
 
                 return self.async_create_entry(
                     title=info["title"],
@@ -76,8 +98,25 @@ class AvalonMiniConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def async_step_import(self, user_input: dict[str, Any]):
-        """Handle YAML import (optional)."""
-        # If you want to support `avalon_mini:` in configuration.yaml,
-        # you can implement this; for now we'll just reuse async_step_user logic.
-        return await self.async_step_user(user_input)
+
+class AvalonMiniOptionsFlow(config_entries.OptionsFlow):
+    """Let users trade update latency for fewer round trips to the miner."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Manage the polling interval."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        current = self._entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        data_schema = vol.Schema(
+            {
+                vol.Optional(CONF_SCAN_INTERVAL, default=current): vol.All(
+                    vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -3,8 +3,11 @@ DOMAIN = "avalon_mini"
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_NAME = "name"
+CONF_SCAN_INTERVAL = "scan_interval"
 
 DEFAULT_PORT = 4028
 DEFAULT_NAME = "Avalon Mini 3"
+DEFAULT_SCAN_INTERVAL = 30  # seconds
+MIN_SCAN_INTERVAL = 10  # seconds
 
 PLATFORMS = ["switch", "select", "sensor"]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import AvalonMiniCoordinator
+
+
+class AvalonBaseEntity(CoordinatorEntity[AvalonMiniCoordinator]):
+    """Common base for every Avalon Mini entity: naming and unique ID."""
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: AvalonMiniCoordinator,
+        name: str,
+        entry: ConfigEntry,
+        suffix: str,
+        label: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._attr_name = f"{name} {label}"
+        self._attr_unique_id = f"{entry.entry_id}_{suffix}"
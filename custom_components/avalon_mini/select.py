@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from datetime import timedelta  # <-- see note below
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import AvalonMiniCoordinator
 from .const import DOMAIN
-
-SCAN_INTERVAL = timedelta(seconds=30)
+from .entity import AvalonBaseEntity
 
 # Labels shown in HA
 MODE_OPTIONS = ["heating", "mining", "night"]
@@ -26,9 +25,11 @@ LEVEL_TO_INDEX = {
     "super": 0,
 }
 
-# Map device indices -> HA labels
-INDEX_TO_MODE = {v: k for k, v in MODE_TO_INDEX.items()}
-INDEX_TO_LEVEL = {v: k for k, v in LEVEL_TO_INDEX.items()}
+# Map device indices -> HA labels. Indices are small and contiguous, so a
+# tuple lookup replaces a dict probe; levels start at -1, hence the offset.
+INDEX_TO_MODE = ("heating", "mining", "night")
+INDEX_TO_LEVEL = ("eco", "super")
+LEVEL_INDEX_OFFSET = 1
 
 
 async def async_setup_entry(
@@ -39,89 +40,77 @@ async def async_setup_entry(
     """Set up Avalon Mini selects (mode, level) from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
     client = data["client"]
+    coordinator = data["coordinator"]
     name = data["name"]
 
     entities = [
-        AvalonModeSelect(client, name, entry),
-        AvalonLevelSelect(client, name, entry),
+        AvalonModeSelect(coordinator, client, name, entry),
+        AvalonLevelSelect(coordinator, client, name, entry),
     ]
 
     async_add_entities(entities)
 
 
-class AvalonModeSelect(SelectEntity):
+class AvalonModeSelect(AvalonBaseEntity, SelectEntity):
     """Select entity for Avalon Mini mode (heating, mining, night)."""
 
+    __slots__ = ("_client",)
+
     _attr_options = MODE_OPTIONS
-    _attr_should_poll = True
 
-    def __init__(self, client, name: str, entry: ConfigEntry) -> None:
+    def __init__(
+        self, coordinator: AvalonMiniCoordinator, client, name: str, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, name, entry, "mode", "Mode")
         self._client = client
-        slug = entry.entry_id
-        self._attr_name = f"{name} Mode"
-        self._attr_unique_id = f"{slug}_mode"
-        self._current_option = "heating"
 
     @property
-    def current_option(self) -> str:
-        return self._current_option
+    def current_option(self) -> str | None:
+        mode_index = self.coordinator.data.workmode
+        if mode_index is None or not 0 <= mode_index < len(INDEX_TO_MODE):
+            return None
+        return INDEX_TO_MODE[mode_index]
 
     async def async_select_option(self, option: str) -> None:
         """Called when user changes the option in Home Assistant."""
         if option not in MODE_TO_INDEX:
             return
         index = MODE_TO_INDEX[option]
-        await self.hass.async_add_executor_job(self._client.set_mode_index, index)
-        self._current_option = option
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Poll device for current mode so external changes are reflected."""
-        status = await self.hass.async_add_executor_job(self._client.get_status)
-        mode_index = status.get("workmode")
-        if mode_index is None:
-            return
+        await self._client.async_set_mode_index(index)
+        # Show the new value right away; the debounced refresh confirms it
+        self.coordinator.async_set_status(workmode=index)
+        await self.coordinator.async_request_refresh()
 
-        option = INDEX_TO_MODE.get(mode_index)
-        if option is not None and option != self._current_option:
-            self._current_option = option
-            self.async_write_ha_state()
 
-
-class AvalonLevelSelect(SelectEntity):
+class AvalonLevelSelect(AvalonBaseEntity, SelectEntity):
     """Select entity for Avalon Mini level (eco, super)."""
 
+    __slots__ = ("_client",)
+
     _attr_options = LEVEL_OPTIONS
-    _attr_should_poll = True
 
-    def __init__(self, client, name: str, entry: ConfigEntry) -> None:
+    def __init__(
+        self, coordinator: AvalonMiniCoordinator, client, name: str, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, name, entry, "level", "Level")
         self._client = client
-        slug = entry.entry_id
-        self._attr_name = f"{name} Level"
-        self._attr_unique_id = f"{slug}_level"
-        self._current_option = "eco"
 
     @property
-    def current_option(self) -> str:
-        return self._current_option
+    def current_option(self) -> str | None:
+        level_index = self.coordinator.data.worklevel
+        if level_index is None:
+            return None
+        slot = level_index + LEVEL_INDEX_OFFSET
+        if not 0 <= slot < len(INDEX_TO_LEVEL):
+            return None
+        return INDEX_TO_LEVEL[slot]
 
     async def async_select_option(self, option: str) -> None:
         """Called when user changes level in Home Assistant."""
         if option not in LEVEL_TO_INDEX:
             return
         index = LEVEL_TO_INDEX[option]
-        await self.hass.async_add_executor_job(self._client.set_level_index, index)
-        self._current_option = option
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Poll device for current level so external changes are reflected."""
-        status = await self.hass.async_add_executor_job(self._client.get_status)
-        level_index = status.get("worklevel")
-        if level_index is None:
-            return
-
-        option = INDEX_TO_LEVEL.get(level_index)
-        if option is not None and option != self._current_option:
-            self._current_option = option
-            self.async_write_ha_state()
+        await self._client.async_set_level_index(index)
+        # Show the new value right away; the debounced refresh confirms it
+        self.coordinator.async_set_status(worklevel=index)
+        await self.coordinator.async_request_refresh()
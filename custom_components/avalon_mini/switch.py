@@ -1,20 +1,32 @@
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 import time
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 
+from . import REQUEST_REFRESH_COOLDOWN, AvalonMiniCoordinator
+from .avalon_api import DEFAULT_TIMEOUT
 from .const import DOMAIN
+from .entity import AvalonBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# How often Home Assistant will poll for state
-SCAN_INTERVAL = timedelta(seconds=30)
+# SYSTEMSTATU "Work:" values that mean the miner is powered on.
+# From your observation:
+#   On  -> SYSTEMSTATU[Work: In Work, Hash Board: 1]
+#   On  -> SYSTEMSTATU[Work: In Init, Hash Board: 1]
+#   Off -> SYSTEMSTATU[Work: In Idle, Hash Board: 1]
+_ON_STATES = frozenset(("In Work", "In Init"))
+
+# How long the optimistic power state wins over estats after a command.
+# It must outlast the refresh the command requests: the debounce cooldown,
+# then a poll that may take a connect and two replies to time out.
+_POWER_GRACE_PERIOD = REQUEST_REFRESH_COOLDOWN + 3 * DEFAULT_TIMEOUT
 
 
 async def async_setup_entry(
@@ -25,70 +37,81 @@ async def async_setup_entry(
     """Set up Avalon Mini switches (power, display) from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
     client = data["client"]
+    coordinator = data["coordinator"]
     name = data["name"]
 
     entities: list[SwitchEntity] = [
-        AvalonPowerSwitch(client, name, entry),
-        AvalonDisplaySwitch(client, name, entry),
+        AvalonPowerSwitch(coordinator, client, name, entry),
+        AvalonDisplaySwitch(coordinator, client, name, entry),
     ]
 
     async_add_entities(entities)
 
 
-class AvalonPowerSwitch(SwitchEntity):
+class AvalonPowerSwitch(AvalonBaseEntity, SwitchEntity, RestoreEntity):
     """Switch to control Avalon Mini power (soft on/off)."""
 
+    __slots__ = ("_client", "_is_on", "_pending_until")
+
     _attr_icon = "mdi:power"
-    _attr_should_poll = True
 
-    def __init__(self, client, name: str, entry: ConfigEntry) -> None:
+    def __init__(
+        self, coordinator: AvalonMiniCoordinator, client, name: str, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, name, entry, "power", "Power")
         self._client = client
-        slug = entry.entry_id
-        self._attr_name = f"{name} Power"
-        self._attr_unique_id = f"{slug}_power"
         self._is_on = False  # best-effort tracked state
         # Grace period after issuing a power command during which we don't override
         # the optimistic state with stale status from estats.
         self._pending_until: float | None = None
+        self._apply_status()
 
     @property
     def is_on(self) -> bool:
         return self._is_on
 
+    async def async_added_to_hass(self) -> None:
+        """Fall back to the last known state if estats had no SYSTEMSTATU."""
+        await super().async_added_to_hass()
+        if self.coordinator.data.system_work:
+            return
+        last = await self.async_get_last_state()
+        if last is not None and last.state in ("on", "off"):
+            self._is_on = last.state == "on"
+
     async def async_turn_on(self, **kwargs) -> None:
         """Handle turning the miner on from Home Assistant."""
-        await self.hass.async_add_executor_job(self._client.power_on)
+        await self._client.async_power_on()
         # Optimistically set state and start a short grace period
-        self._is_on = True
-        self._pending_until = time.monotonic() + 5  # seconds
-        self.async_write_ha_state()
+        self._pending_until = time.monotonic() + _POWER_GRACE_PERIOD
+        # The command is always sent, but only a real change is broadcast
+        if not self._is_on:
+            self._is_on = True
+            self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Handle turning the miner off from Home Assistant."""
-        await self.hass.async_add_executor_job(self._client.power_off)
-        self._is_on = False
-        self._pending_until = time.monotonic() + 5  # seconds
-        self.async_write_ha_state()
+        await self._client.async_power_off()
+        self._pending_until = time.monotonic() + _POWER_GRACE_PERIOD
+        if self._is_on:
+            self._is_on = False
+            self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
 
-    async def async_update(self) -> None:
-        """Poll device for power state so external changes are reflected."""
+    def _apply_status(self) -> None:
+        """Take the power state from the coordinator's latest estats."""
         # If we're still within the grace period after a manual command,
         # don't override the optimistic state yet.
         if self._pending_until is not None and time.monotonic() < self._pending_until:
             return
 
-        status = await self.hass.async_add_executor_job(self._client.get_status)
-        system_work = status.get("system_work")
+        system_work = self.coordinator.data.system_work
 
         if not system_work:
             return
 
-        # From your observation:
-        #   On  -> SYSTEMSTATU[Work: In Work, Hash Board: 1]
-        #   On  -> SYSTEMSTATU[Work: In Init, Hash Board: 1]
-        #   Off -> SYSTEMSTATU[Work: In Idle, Hash Board: 1]
-        on_states = {"In Work", "In Init"}
-        is_on = system_work in on_states
+        is_on = system_work in _ON_STATES
 
         # Once we've trusted the real status, clear any pending flag
         self._pending_until = None
@@ -96,42 +119,63 @@ class AvalonPowerSwitch(SwitchEntity):
         if is_on != self._is_on:
             _LOGGER.debug("Power state from SYSTEMSTATU '%s' -> %s", system_work, is_on)
             self._is_on = is_on
-            self.async_write_ha_state()
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reflect external power changes picked up by the coordinator."""
+        self._apply_status()
+        super()._handle_coordinator_update()
 
-class AvalonDisplaySwitch(SwitchEntity):
+
+class AvalonDisplaySwitch(AvalonBaseEntity, SwitchEntity, RestoreEntity):
     """Switch to toggle the Avalon Mini display."""
 
+    __slots__ = ("_client", "_is_on")
+
     _attr_icon = "mdi:monitor"
-    _attr_should_poll = True
 
-    def __init__(self, client, name: str, entry: ConfigEntry) -> None:
+    def __init__(
+        self, coordinator: AvalonMiniCoordinator, client, name: str, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, name, entry, "display", "Display")
         self._client = client
-        slug = entry.entry_id
-        self._attr_name = f"{name} Display"
-        self._attr_unique_id = f"{slug}_display"
-        self._is_on = True  # assume on at startup
+        self._is_on = True  # assume on until estats says otherwise
+        self._apply_status()
 
     @property
     def is_on(self) -> bool:
         return self._is_on
 
+    async def async_added_to_hass(self) -> None:
+        """Fall back to the last known state if estats had no LcdOnoff."""
+        await super().async_added_to_hass()
+        if self.coordinator.data.lcd_on is not None:
+            return
+        last = await self.async_get_last_state()
+        if last is not None and last.state in ("on", "off"):
+            self._is_on = last.state == "on"
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the display on."""
-        await self.hass.async_add_executor_job(self._client.set_display, True)
-        self._is_on = True
-        self.async_write_ha_state()
+        await self._async_set_display(True)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the display off."""
-        await self.hass.async_add_executor_job(self._client.set_display, False)
-        self._is_on = False
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Poll device for display state so external changes are reflected."""
-        status = await self.hass.async_add_executor_job(self._client.get_status)
-        lcd_on = status.get("lcd_on")
+        await self._async_set_display(False)
+
+    async def _async_set_display(self, on: bool) -> None:
+        await self._client.async_set_display(on)
+        lcd_on = 1 if on else 0
+        # Put the optimistic value in the shared state, like the selects do,
+        # so another entity's optimistic push cannot revert it. The command
+        # is always sent, but only a real change is broadcast.
+        if self.coordinator.data.lcd_on != lcd_on:
+            self.coordinator.async_set_status(lcd_on=lcd_on)
+        await self.coordinator.async_request_refresh()
+
+    def _apply_status(self) -> None:
+        """Take the display state from the coordinator's latest estats."""
+        lcd_on = self.coordinator.data.lcd_on
         if lcd_on is None:
             return
 
@@ -139,4 +183,9 @@ class AvalonDisplaySwitch(SwitchEntity):
         if is_on != self._is_on:
             _LOGGER.debug("Display state from LcdOnoff[%s] -> %s", lcd_on, is_on)
             self._is_on = is_on
-            self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reflect external display changes picked up by the coordinator."""
+        self._apply_status()
+        super()._handle_coordinator_update()